@@ -1,14 +1,35 @@
 from fastapi import FastAPI, Depends, HTTPException, File, UploadFile
+from sqlalchemy import text as sql_text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 from database import SessionLocal, engine, Base
 import models, schemas
 from gtts import gTTS
 from fastapi.responses import FileResponse
+from contextlib import asynccontextmanager
+import anyio
 import os
 
-Base.metadata.create_all(bind=engine)
+def init_db():
+    """Create tables and pre-open the DB pool"""
+    try:
+        Base.metadata.create_all(bind=engine)
+    except OperationalError:
+        # Another worker created the tables between the check and CREATE TABLE;
+        # the second pass finds them and has nothing left to do
+        Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        connection.execute(sql_text("SELECT 1"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialise the database on startup, dispose the pool on shutdown"""
+    # init_db() blocks on database I/O, so keep it off the event loop
+    await anyio.to_thread.run_sync(init_db)
+    yield
+    engine.dispose()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 def get_db():
     db = SessionLocal()
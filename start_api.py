@@ -2,10 +2,14 @@
 """
 Voice Clone API Startup Script
 This script checks dependencies, sets up the environment, and starts the FastAPI server.
+
+Run with --production (or APP_ENV=production) to skip the dev-only checks and
+serve with multiple worker processes.
 """
 
 import os
 import sys
+import argparse
 import subprocess
 import importlib.util
 from pathlib import Path
@@ -54,13 +58,17 @@ def check_dependencies():
     
     return True
 
-def check_environment():
+def check_environment(production=False):
     """Check environment variables and create directories"""
     print("\n🔧 Setting up environment...")
     
     # Check for API key
     api_key = os.getenv("ELEVENLABS_API_KEY")
-    if not api_key or api_key == "your-elevenlabs-api-key-here":
+    if not api_key or api_key in ("your-elevenlabs-api-key-here", "your-elevenlabs-api-key"):
+        if production:
+            # Every clone request would fail upstream, so refuse to start
+            print("❌ Error: ELEVENLABS_API_KEY must be set in production mode")
+            return False
         print("⚠️  Warning: ELEVENLABS_API_KEY not set")
         print("   Create a .env file with your ElevenLabs API key:")
         print("   ELEVENLABS_API_KEY=your-actual-api-key")
@@ -80,6 +88,53 @@ def check_environment():
     
     return True
 
+def get_int_env(name, default, minimum):
+    """Read an integer setting from the environment, or None if it is invalid"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        print(f"❌ Error: {name} must be an integer >= {minimum}, got {value!r}")
+        return None
+    return number
+
+def get_worker_count():
+    """Number of worker processes, from WEB_CONCURRENCY or the cores this process may use"""
+    if os.getenv("WEB_CONCURRENCY"):
+        return get_int_env("WEB_CONCURRENCY", None, 1)
+
+    # Respect CPU affinity (containers, pinned deployments) where supported
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def start_production_server(workers, port, graceful_timeout):
+    """Start the FastAPI server in production mode"""
+    host = os.getenv("HOST", "0.0.0.0")
+
+    print(f"🚀 Starting Voice Clone API with {workers} workers on http://{host}:{port}")
+
+    import uvicorn
+
+    # The app is passed as an import string so each worker imports it itself;
+    # "auto" picks uvloop and httptools when they are installed. Each worker
+    # warms up its pools before it starts accepting connections, and on
+    # shutdown in-flight requests get graceful_timeout seconds to drain.
+    uvicorn.run(
+        "voice_clone_api:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        reload=False,
+        timeout_graceful_shutdown=graceful_timeout,
+    )
+
 def start_server():
     """Start the FastAPI server"""
     print("\n🚀 Starting Voice Clone API server...")
@@ -104,8 +159,45 @@ def start_server():
     
     return True
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Start the Voice Clone API server")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        default=os.getenv("APP_ENV") == "production",
+        help="Run multiple workers and skip the dependency checks (or set APP_ENV=production)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, production mode only (default: WEB_CONCURRENCY or CPU count)"
+    )
+    args = parser.parse_args()
+    if args.workers is not None and not args.production:
+        parser.error("--workers requires --production")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
 def main():
     """Main startup function"""
+    args = parse_args()
+
+    if args.production:
+        workers = args.workers or get_worker_count()
+        port = get_int_env("PORT", 8000, 1)
+        graceful_timeout = get_int_env("GRACEFUL_SHUTDOWN_TIMEOUT", 30, 0)
+        if None in (workers, port, graceful_timeout):
+            sys.exit(1)
+        if not check_python_version():
+            sys.exit(1)
+        if not check_environment(production=True):
+            sys.exit(1)
+        start_production_server(workers, port, graceful_timeout)
+        return
+
     print("🎤 Voice Clone API Startup")
     print("=" * 40)
     
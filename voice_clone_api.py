@@ -10,16 +10,53 @@ import requests
 from typing import Optional
 import json
 import logging
+import anyio
+from http.cookiejar import DefaultCookiePolicy
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Configuration
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY", "your-elevenlabs-api-key")
+ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
+UPLOAD_DIR = "uploads/voice_samples"
+OUTPUT_DIR = "outputs/generated_speech"
+MAX_FILE_SIZE = 15 * 1024 * 1024  # 15MB
+ALLOWED_AUDIO_TYPES = ["audio/wav", "audio/mp3", "audio/webm", "audio/mpeg"]
+WARMUP_TIMEOUT = 5  # seconds
+
+# Shared HTTP session so upstream connections are pooled and reused
+http_session = requests.Session()
+# The session is shared by all users, so never keep cookies from upstream
+http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+def warm_up():
+    """Pre-open the upstream connection pool before serving traffic"""
+    try:
+        http_session.head(ELEVENLABS_BASE_URL, timeout=WARMUP_TIMEOUT)
+        logger.info("Upstream connection pool warmed up")
+    except requests.RequestException as e:
+        logger.warning(f"Upstream warm-up failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare directories and warm up pools on startup, release them on shutdown"""
+    # Create directories if they don't exist
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # warm_up() blocks on network I/O, so keep it off the event loop
+    await anyio.to_thread.run_sync(warm_up)
+    yield
+    http_session.close()
+
 app = FastAPI(
     title="Voice Clone API",
     description="API for voice cloning and speech synthesis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -31,18 +68,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configuration
-ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY", "your-elevenlabs-api-key")
-ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
-UPLOAD_DIR = "uploads/voice_samples"
-OUTPUT_DIR = "outputs/generated_speech"
-MAX_FILE_SIZE = 15 * 1024 * 1024  # 15MB
-ALLOWED_AUDIO_TYPES = ["audio/wav", "audio/mp3", "audio/webm", "audio/mpeg"]
-
-# Create directories if they don't exist
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
 class VoiceCloneRequest(BaseModel):
     text: str
     voice_sample_url: Optional[str] = None
@@ -97,7 +122,7 @@ def create_voice_with_elevenlabs(voice_sample_path: str) -> str:
                 "xi-api-key": ELEVENLABS_API_KEY
             }
             
-            response = requests.post(add_voice_url, files=files, headers=headers)
+            response = http_session.post(add_voice_url, files=files, headers=headers)
             
             if response.status_code == 200:
                 voice_data = response.json()
@@ -132,7 +157,7 @@ def generate_speech_with_elevenlabs(text: str, voice_id: str) -> str:
             }
         }
         
-        response = requests.post(tts_url, json=data, headers=headers)
+        response = http_session.post(tts_url, json=data, headers=headers)
         
         if response.status_code == 200:
             # Save the generated audio
@@ -241,7 +266,7 @@ async def list_voices():
             "xi-api-key": ELEVENLABS_API_KEY
         }
         
-        response = requests.get(f"{ELEVENLABS_BASE_URL}/voices", headers=headers)
+        response = http_session.get(f"{ELEVENLABS_BASE_URL}/voices", headers=headers)
         
         if response.status_code == 200:
             voices = response.json()
@@ -261,7 +286,7 @@ async def delete_voice(voice_id: str):
             "xi-api-key": ELEVENLABS_API_KEY
         }
         
-        response = requests.delete(f"{ELEVENLABS_BASE_URL}/voices/{voice_id}", headers=headers)
+        response = http_session.delete(f"{ELEVENLABS_BASE_URL}/voices/{voice_id}", headers=headers)
         
         if response.status_code == 200:
             return {"message": "Voice deleted successfully"}